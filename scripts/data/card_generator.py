@@ -6,55 +6,106 @@ Professional credit card and person information generator
 Based on Luhn algorithm and Markov chain optimization
 """
 
+import bisect
+import functools
 import json
+import os
 import random
 import hashlib
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+from itertools import accumulate, repeat
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is optional; without it generation falls back to the scalar path
+    np = None
+
+try:
+    import orjson
+
+    def _load_json(path: str):
+        """Parse a JSON file with orjson (2-5x faster than stdlib json)"""
+        return orjson.loads(Path(path).read_bytes())
+except ImportError:
+    def _load_json(path: str):
+        """Parse a JSON file with the stdlib json module"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
 
 
 class LuhnValidator:
     """Luhn algorithm implementation for credit card validation"""
-    
+
+    # SWAR masks keyed by (number length, doubling parity)
+    _MASK_CACHE: Dict[Tuple[int, int], Tuple[int, int, int]] = {}
+
+    @classmethod
+    def _masks(cls, length: int, parity: int) -> Tuple[int, int, int]:
+        """Get (digit lanes, doubled lanes, lane ones) masks for a number length"""
+        key = (length, parity)
+        masks = cls._MASK_CACHE.get(key)
+
+        if masks is None:
+            low = int.from_bytes(b'\x0f' * length, 'big')
+            ones = int.from_bytes(b'\x01' * length, 'big')
+            double = int.from_bytes(
+                bytes(0x0f if (length - 1 - i) % 2 == parity else 0x00 for i in range(length)),
+                'big'
+            )
+            masks = (low, double, ones)
+            cls._MASK_CACHE[key] = masks
+
+        return masks
+
+    @classmethod
+    def _luhn_sum(cls, card_number: str, parity: int) -> int:
+        """Compute the Luhn digit sum over the whole number at once (SWAR)
+
+        The ASCII digits are packed into one wide integer with one byte lane
+        per digit, so doubling, the >9 fixup, and the final sum are a handful
+        of integer operations instead of a per-digit Python loop.
+        """
+        length = len(card_number)
+        low, double, ones = cls._masks(length, parity)
+
+        lanes = int.from_bytes(card_number.encode('ascii'), 'big') & low
+
+        # Double every second lane; a doubled lane is at most 18, so no carry
+        doubled = (lanes & double) << 1
+
+        # Lanes >= 10 need a -9 fixup; adding 6 sets bit 4 exactly when lane >= 10
+        overflow = ((doubled + 6 * ones) >> 4) & ones
+        doubled -= 9 * overflow
+
+        # Horizontal sum: multiplying by lane ones accumulates all lanes
+        # into the top byte (total <= 9 * 19 digits, so it cannot overflow)
+        summed = (doubled | (lanes & ~double)) * ones
+        return (summed >> (8 * (length - 1))) & 0xff
+
     @staticmethod
     def calculate_check_digit(card_number: str) -> str:
         """Calculate Luhn check digit"""
-        total = 0
-        should_double = True
-        
-        for digit in reversed(card_number):
-            n = int(digit)
-            
-            if should_double:
-                n *= 2
-                if n > 9:
-                    n -= 9
-            
-            total += n
-            should_double = not should_double
-        
-        check_digit = (10 - (total % 10)) % 10
-        return str(check_digit)
-    
+        total = LuhnValidator._luhn_sum(card_number, 0)
+        return str((10 - (total % 10)) % 10)
+
+    @staticmethod
+    def calculate_check_digits(digits: 'np.ndarray') -> 'np.ndarray':
+        """Calculate Luhn check digits for a (batch, length) uint8 digit matrix"""
+        doubled = digits.astype(np.int16)
+        doubled[:, -1::-2] *= 2
+        doubled[doubled > 9] -= 9
+
+        totals = doubled.sum(axis=1)
+        return ((10 - totals % 10) % 10).astype(np.uint8)
+
     @staticmethod
     def validate(card_number: str) -> bool:
         """Validate complete card number using Luhn algorithm"""
-        total = 0
-        should_double = False
-        
-        for digit in reversed(card_number):
-            n = int(digit)
-            
-            if should_double:
-                n *= 2
-                if n > 9:
-                    n -= 9
-            
-            total += n
-            should_double = not should_double
-        
-        return total % 10 == 0
+        return LuhnValidator._luhn_sum(card_number, 1) % 10 == 0
 
 
 class MarkovChainGenerator:
@@ -74,24 +125,59 @@ class MarkovChainGenerator:
         9: [0.10, 0.11, 0.10, 0.09, 0.11, 0.10, 0.09, 0.11, 0.10, 0.09]
     }
     
+    # Cumulative transition rows, precomputed for bisect-based sampling
+    _CUMULATIVE_ROWS = tuple(
+        tuple(accumulate(row)) for _, row in sorted(TRANSITION_MATRIX.items())
+    )
+
+    # Row-wise cumulative transition matrix for the vectorized path
+    _CUMULATIVE = None
+
     @classmethod
-    def get_next_digit(cls, previous_segment: str) -> int:
+    def _cumulative_matrix(cls) -> 'np.ndarray':
+        """Get the (10, 10) cumulative transition matrix, building it once"""
+        if cls._CUMULATIVE is None:
+            matrix = np.array([cls.TRANSITION_MATRIX[d] for d in range(10)])
+            cls._CUMULATIVE = np.cumsum(matrix, axis=1)
+        return cls._CUMULATIVE
+
+    @classmethod
+    def generate_digit_matrix(cls, first_digits: 'np.ndarray', length: int,
+                              rng: 'np.random.Generator') -> 'np.ndarray':
+        """Generate a (batch, length) matrix of Markov chain digits at once
+
+        Column 0 is taken from `first_digits`; each following column is drawn
+        for the whole batch in one vectorized step by comparing uniform draws
+        against the cumulative transition rows of the previous column.
+        """
+        cumulative = cls._cumulative_matrix()
+        batch = len(first_digits)
+
+        digits = np.empty((batch, length), dtype=np.uint8)
+        digits[:, 0] = first_digits
+
+        for t in range(1, length):
+            u = rng.random(batch)
+            digits[:, t] = (cumulative[digits[:, t - 1]] < u[:, None]).sum(axis=1)
+
+        return digits
+
+    @classmethod
+    def get_next_digit(cls, previous_segment: str,
+                       rng: Optional[random.Random] = None) -> int:
         """Generate next digit using Markov chain"""
+        if rng is None:
+            rng = random
+
         if not previous_segment:
-            return random.randint(0, 9)
-        
+            return rng.randint(0, 9)
+
         last_digit = int(previous_segment[-1])
-        probabilities = cls.TRANSITION_MATRIX[last_digit]
-        
-        rand = random.random()
-        cumulative = 0
-        
-        for digit in range(10):
-            cumulative += probabilities[digit]
-            if rand < cumulative:
-                return digit
-        
-        return 0
+        cumulative = cls._CUMULATIVE_ROWS[last_digit]
+
+        # First index whose cumulative weight exceeds the draw, via C-level bisect
+        digit = bisect.bisect_right(cumulative, rng.random())
+        return digit if digit < 10 else 0
 
 
 class BINDatabase:
@@ -104,40 +190,42 @@ class BINDatabase:
             script_dir = Path(__file__).parent
             db_path = str(script_dir.parent / 'public' / 'bin-database.json')
         self.database = self._load_database(db_path)
-    
+        self._trie = self._build_trie(self.database)
+
     def _load_database(self, path: str) -> Dict:
         """Load BIN database from file"""
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return data.get('bins', {})
+            return _load_json(path).get('bins', {})
         except Exception as e:
             print(f"⚠️ BIN database load failed: {e}")
             return {}
-    
+
+    @staticmethod
+    def _build_trie(bins: Dict) -> Dict:
+        """Build a character trie over the BIN prefixes for longest-prefix lookup"""
+        root = {}
+        for prefix, entry in bins.items():
+            node = root
+            for char in prefix:
+                node = node.setdefault(char, {})
+            node[''] = entry
+        return root
+
     def detect_card_brand(self, bin_code: str) -> Dict:
         """Detect card brand from BIN"""
-        # Try exact match
-        if bin_code in self.database:
-            return self.database[bin_code]
-        
-        # Try 4-digit match
-        bin_4 = bin_code[:4]
-        if bin_4 in self.database:
-            return self.database[bin_4]
-        
-        # Try 2-digit match
-        bin_2 = bin_code[:2]
-        if bin_2 in self.database:
-            return self.database[bin_2]
-        
-        # Try 1-digit match
-        bin_1 = bin_code[:1]
-        if bin_1 in self.database:
-            return self.database[bin_1]
-        
-        # Fallback to traditional rules
-        return self._detect_by_rules(bin_code)
+        # Longest prefix wins: walk the trie, remembering the deepest entry
+        node = self._trie
+        best = None
+
+        for char in bin_code:
+            node = node.get(char)
+            if node is None:
+                break
+            entry = node.get('')
+            if entry is not None:
+                best = entry
+
+        return best or self._detect_by_rules(bin_code)
     
     def _detect_by_rules(self, bin_code: str) -> Dict:
         """Detect card brand using traditional rules"""
@@ -157,10 +245,13 @@ class CardGenerator:
     def __init__(self, bin_db_path: Optional[str] = None):
         """Initialize card generator"""
         self.bin_db = BINDatabase(bin_db_path)
+        self._rng = random.Random()
+        self._np_rng = np.random.default_rng() if np is not None else None
     
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def hash_bank_name(bank_name: str) -> int:
-        """Generate hash seed from bank name"""
+        """Generate hash seed from bank name (cached, the set of banks is small)"""
         if not bank_name or bank_name == "Unknown":
             return 0
         
@@ -168,58 +259,106 @@ class CardGenerator:
         hash_hex = hash_obj.hexdigest()
         return int(hash_hex[:8], 16) % 100
     
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _branch_code(bin_code: str, bank_name: str) -> str:
+        """First 2 segment digits - branch code, invariant per (BIN, bank)"""
+        bank_seed = CardGenerator.hash_bank_name(bank_name)
+        bin_last_4 = bin_code[-4:] if len(bin_code) >= 4 else bin_code
+        return str((int(bin_last_4) + bank_seed) % 100).zfill(2)
+
     def generate_account_segment(self, length: int, bin_code: str, bank_name: str) -> str:
         """Generate account number segment"""
-        segment = ""
-        bank_seed = self.hash_bank_name(bank_name)
-        
         # First 2 digits - branch code
-        bin_last_4 = bin_code[-4:] if len(bin_code) >= 4 else bin_code
-        branch_code = (int(bin_last_4) + bank_seed) % 100
-        segment += str(branch_code).zfill(2)
-        
+        segment = self._branch_code(bin_code, bank_name)
+
         # Middle digits - Markov chain
         for _ in range(length - 4):
-            next_digit = MarkovChainGenerator.get_next_digit(segment)
+            next_digit = MarkovChainGenerator.get_next_digit(segment, self._rng)
             segment += str(next_digit)
-        
+
         # Last 2 digits - sequence number
-        sequence = random.randint(10, 99)
+        sequence = self._rng.randint(10, 99)
         segment += str(sequence)
-        
+
         return segment
-    
-    @staticmethod
-    def generate_expiry_date() -> Tuple[str, str]:
+
+    def generate_account_segments(self, length: int, bin_code: str, bank_name: str,
+                                  quantity: int) -> List[str]:
+        """Generate a batch of account number segments (scalar fallback path)"""
+        return [self.generate_account_segment(length, bin_code, bank_name)
+                for _ in range(quantity)]
+
+    def _generate_card_numbers(self, bin_code: str, brand_info: Dict,
+                               quantity: int) -> List[str]:
+        """Generate full card numbers as one uint8 digit matrix
+
+        The BIN, branch code, Markov middle digits, sequence numbers, and
+        Luhn check digits are all written into a single (batch, length)
+        array; strings are only produced once at the end.
+        """
+        card_length = brand_info.get('length', 16)
+        bank_name = brand_info.get('bank', 'Unknown')
+
+        branch = self._branch_code(bin_code, bank_name)
+        prefix = np.frombuffer((bin_code + branch).encode('ascii'), dtype=np.uint8) - 0x30
+
+        digits = np.empty((quantity, card_length), dtype=np.uint8)
+        digits[:, :len(prefix)] = prefix
+
+        # Middle digits - Markov chain, one matrix for the whole batch
+        middle_length = card_length - len(prefix) - 3
+        if middle_length > 0:
+            seeds = np.full(quantity, prefix[-1], dtype=np.uint8)
+            digits[:, len(prefix):len(prefix) + middle_length] = \
+                MarkovChainGenerator.generate_digit_matrix(
+                    seeds, middle_length + 1, self._np_rng)[:, 1:]
+
+        # Last 2 account digits - sequence number
+        sequences = self._np_rng.integers(10, 100, size=quantity, dtype=np.uint8)
+        digits[:, -3] = sequences // 10
+        digits[:, -2] = sequences % 10
+
+        # Check digits for the whole batch at once
+        digits[:, -1] = LuhnValidator.calculate_check_digits(digits[:, :-1])
+
+        ascii_rows = (digits + 0x30).tobytes().decode('ascii')
+        return [ascii_rows[i * card_length:(i + 1) * card_length]
+                for i in range(quantity)]
+
+    # Years-to-add distribution, precomputed as cumulative weights for bisect
+    _YEAR_OFFSETS = (2, 3, 4, 5, 6)
+    _YEAR_CUMULATIVE = (0.15, 0.55, 0.80, 0.95, 1.00)
+
+    _COMMON_MONTHS = (3, 5, 6, 9, 11, 12)
+
+    def generate_expiry_date(self) -> Tuple[str, str]:
         """Generate realistic expiry date"""
-        year_weights = [
-            (2, 0.15), (3, 0.40), (4, 0.25), (5, 0.15), (6, 0.05)
-        ]
-        
-        rand = random.random()
-        cumulative = 0
-        years_to_add = 3
-        
-        for years, weight in year_weights:
-            cumulative += weight
-            if rand < cumulative:
-                years_to_add = years
-                break
-        
+        rng = self._rng
+        years_to_add = self._YEAR_OFFSETS[
+            bisect.bisect(self._YEAR_CUMULATIVE, rng.random())]
+
         # Month distribution
-        common_months = [3, 5, 6, 9, 11, 12]
-        if random.random() < 0.8:
-            month = random.choice(common_months)
+        if rng.random() < 0.8:
+            month = rng.choice(self._COMMON_MONTHS)
         else:
-            month = random.randint(1, 12)
+            month = rng.randint(1, 12)
         
         expiry_date = datetime.now() + timedelta(days=365 * years_to_add)
         return f"{month:02d}/{expiry_date.year % 100:02d}"
     
+    # Expiry dates only take ~60 distinct values, so cache their int encoding
+    _EXPIRY_INT_CACHE: Dict[str, int] = {}
+
     @staticmethod
     def generate_cvv(card_number: str, expiry_date: str, cvv_length: int) -> str:
         """Generate CVV code"""
-        seed = int(card_number[-4:]) + int(expiry_date.replace('/', ''))
+        expiry_int = CardGenerator._EXPIRY_INT_CACHE.get(expiry_date)
+        if expiry_int is None:
+            expiry_int = int(expiry_date.replace('/', ''))
+            CardGenerator._EXPIRY_INT_CACHE[expiry_date] = expiry_int
+
+        seed = int(card_number[-4:]) + expiry_int
         pseudo_random = (seed * 9301 + 49297) % 233280
         
         if cvv_length == 4:
@@ -227,9 +366,8 @@ class CardGenerator:
         else:
             cvv = str((pseudo_random % 900) + 100)
         
-        # Avoid weak patterns
-        weak_patterns = ['111', '222', '333', '444', '555', '666', '777', '888', '999', '000']
-        if cvv[:3] in weak_patterns:
+        # Avoid weak patterns (three identical leading digits)
+        if cvv[0] == cvv[1] == cvv[2]:
             offset = 1234 if cvv_length == 4 else 123
             if cvv_length == 4:
                 cvv = str(((pseudo_random + offset) % 9000) + 1000)
@@ -241,44 +379,104 @@ class CardGenerator:
     def generate_card(self, bin_code: str = '532959') -> Dict:
         """Generate complete card information"""
         brand_info = self.bin_db.detect_card_brand(bin_code)
-        
-        card_length = brand_info.get('length', 16)
-        cvv_length = brand_info.get('cvvLength', 3)
-        bank_name = brand_info.get('bank', 'Unknown')
-        
+
         # Generate account segment
-        account_length = card_length - len(bin_code) - 1
-        account_segment = self.generate_account_segment(account_length, bin_code, bank_name)
-        
+        account_length = brand_info.get('length', 16) - len(bin_code) - 1
+        account_segment = self.generate_account_segment(
+            account_length, bin_code, brand_info.get('bank', 'Unknown'))
+
+        return self._build_card(bin_code, account_segment, brand_info)
+
+    def generate_cards(self, bin_code: str = '532959', quantity: int = 1) -> List[Dict]:
+        """Generate a batch of cards, vectorizing the Markov, Luhn, expiry, and CVV steps"""
+        brand_info = self.bin_db.detect_card_brand(bin_code)
+
+        if np is None:
+            account_length = brand_info.get('length', 16) - len(bin_code) - 1
+            segments = self.generate_account_segments(
+                account_length, bin_code, brand_info.get('bank', 'Unknown'), quantity)
+            return [self._build_card(bin_code, segment, brand_info) for segment in segments]
+
+        card_numbers = self._generate_card_numbers(bin_code, brand_info, quantity)
+
+        expiry_dates, expiry_ints = self._generate_expiry_dates(quantity)
+        cvvs = self._generate_cvvs(card_numbers, expiry_ints, brand_info.get('cvvLength', 3))
+
+        return [self._card_record(number, expiry_date, cvv, brand_info)
+                for number, expiry_date, cvv in zip(card_numbers, expiry_dates, cvvs)]
+
+    def _generate_expiry_dates(self, quantity: int) -> Tuple[List[str], 'np.ndarray']:
+        """Generate a batch of expiry dates plus their MMYY integer encodings"""
+        rng = self._np_rng
+
+        # One datetime snapshot per batch; only 5 distinct year offsets exist
+        now = datetime.now()
+        yy_by_offset = np.array([(now + timedelta(days=365 * years)).year % 100
+                                 for years in self._YEAR_OFFSETS])
+        yy = yy_by_offset[np.searchsorted(self._YEAR_CUMULATIVE, rng.random(quantity))]
+
+        # Month distribution
+        common = np.asarray(self._COMMON_MONTHS)
+        months = np.where(rng.random(quantity) < 0.8,
+                          common[rng.integers(0, len(common), size=quantity)],
+                          rng.integers(1, 13, size=quantity))
+
+        dates = [f"{month:02d}/{year:02d}" for month, year in zip(months, yy)]
+        return dates, months * 100 + yy
+
+    @staticmethod
+    def _generate_cvvs(card_numbers: List[str], expiry_ints: 'np.ndarray',
+                       cvv_length: int) -> List[str]:
+        """Generate a batch of CVV codes (vectorized generate_cvv arithmetic)"""
+        last4 = np.array([int(number[-4:]) for number in card_numbers], dtype=np.int64)
+        pseudo_random = ((last4 + expiry_ints) * 9301 + 49297) % 233280
+
+        if cvv_length == 4:
+            cvv = (pseudo_random % 9000) + 1000
+            weak = ((cvv // 1000 == (cvv // 100) % 10)
+                    & ((cvv // 100) % 10 == (cvv // 10) % 10))
+            cvv = np.where(weak, ((pseudo_random + 1234) % 9000) + 1000, cvv)
+        else:
+            cvv = (pseudo_random % 900) + 100
+            weak = cvv % 111 == 0
+            cvv = np.where(weak, ((pseudo_random + 123) % 900) + 100, cvv)
+
+        return [str(value) for value in cvv]
+
+    def _build_card(self, bin_code: str, account_segment: str, brand_info: Dict) -> Dict:
+        """Assemble full card information from a generated account segment"""
+        cvv_length = brand_info.get('cvvLength', 3)
+
         # Generate card number without check digit
         card_without_check = bin_code + account_segment
-        
-        # Calculate check digit
+
+        # Calculate check digit (valid by construction, no re-validation needed)
         check_digit = LuhnValidator.calculate_check_digit(card_without_check)
         full_card_number = card_without_check + check_digit
-        
-        # Validate
-        if not LuhnValidator.validate(full_card_number):
-            print(f"⚠️ Luhn validation failed, regenerating...")
-            return self.generate_card(bin_code)
-        
+
         # Generate expiry and CVV
         expiry_date = self.generate_expiry_date()
         cvv = self.generate_cvv(full_card_number, expiry_date, cvv_length)
-        
+
+        return self._card_record(full_card_number, expiry_date, cvv, brand_info)
+
+    @staticmethod
+    def _card_record(full_card_number: str, expiry_date: str, cvv: str,
+                     brand_info: Dict) -> Dict:
+        """Build the output dict for one card"""
         # Format card number
-        if card_length == 15:
+        if brand_info.get('length', 16) == 15:
             formatted = f"{full_card_number[:4]} {full_card_number[4:10]} {full_card_number[10:]}"
         else:
             formatted = f"{full_card_number[:4]} {full_card_number[4:8]} {full_card_number[8:12]} {full_card_number[12:]}"
-        
+
         return {
             'cardNumber': full_card_number,
             'cardNumberFormatted': formatted,
             'expiryDate': expiry_date,
             'cvv': cvv,
             'brand': brand_info.get('brand', 'Unknown'),
-            'bank': bank_name,
+            'bank': brand_info.get('bank', 'Unknown'),
             'country': brand_info.get('country', 'US'),
             'countryName': brand_info.get('countryName', 'United States')
         }
@@ -287,20 +485,20 @@ class CardGenerator:
 class PersonGenerator:
     """US person information generator"""
     
-    FIRST_NAMES_MALE = [
+    FIRST_NAMES_MALE = (
         'James', 'John', 'Robert', 'Michael', 'William', 'David', 'Richard', 'Joseph',
         'Thomas', 'Charles', 'Christopher', 'Daniel', 'Matthew', 'Anthony', 'Donald'
-    ]
-    
-    FIRST_NAMES_FEMALE = [
+    )
+
+    FIRST_NAMES_FEMALE = (
         'Mary', 'Patricia', 'Jennifer', 'Linda', 'Barbara', 'Elizabeth', 'Susan',
         'Jessica', 'Sarah', 'Karen', 'Nancy', 'Lisa', 'Betty', 'Margaret'
-    ]
-    
-    LAST_NAMES = [
+    )
+
+    LAST_NAMES = (
         'Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller', 'Davis',
         'Rodriguez', 'Martinez', 'Wilson', 'Anderson', 'Thomas', 'Taylor', 'Moore'
-    ]
+    )
     
     def __init__(self, address_db_path: Optional[str] = None):
         """Initialize person generator"""
@@ -309,26 +507,26 @@ class PersonGenerator:
             script_dir = Path(__file__).parent
             address_db_path = str(script_dir.parent / 'public' / 'real-addresses.json')
         self.address_database = self._load_address_database(address_db_path)
+        self._rng = random.Random()
     
     def _load_address_database(self, path: str) -> Dict:
         """Load address database"""
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _load_json(path)
         except Exception as e:
             print(f"⚠️ Address database load failed: {e}")
             return {}
     
     def generate_name(self) -> str:
         """Generate US person name"""
-        gender = random.choice(['male', 'female'])
+        gender = self._rng.choice(['male', 'female'])
         
         if gender == 'male':
-            first_name = random.choice(self.FIRST_NAMES_MALE)
+            first_name = self._rng.choice(self.FIRST_NAMES_MALE)
         else:
-            first_name = random.choice(self.FIRST_NAMES_FEMALE)
+            first_name = self._rng.choice(self.FIRST_NAMES_FEMALE)
         
-        last_name = random.choice(self.LAST_NAMES)
+        last_name = self._rng.choice(self.LAST_NAMES)
         return f"{first_name} {last_name}"
     
     def generate_address(self) -> Dict:
@@ -341,7 +539,7 @@ class PersonGenerator:
             if not states:
                 return self._generate_fallback_address()
             
-            state = random.choice(states)
+            state = self._rng.choice(states)
             cities = us_data[state]
             
             # Random city
@@ -349,14 +547,14 @@ class PersonGenerator:
             if not city_names:
                 return self._generate_fallback_address()
             
-            city = random.choice(city_names)
+            city = self._rng.choice(city_names)
             addresses = cities[city]
             
             # Random address
             if not addresses:
                 return self._generate_fallback_address()
             
-            address = random.choice(addresses)
+            address = self._rng.choice(addresses)
             
             return {
                 'street': address['street'],
@@ -371,14 +569,14 @@ class PersonGenerator:
             print(f"⚠️ Address generation failed: {e}")
             return self._generate_fallback_address()
     
+    _FALLBACK_STREETS = ('Main', 'Oak', 'Maple', 'Cedar', 'Elm', 'Washington')
+    _FALLBACK_SUFFIXES = ('St', 'Ave', 'Rd', 'Dr', 'Ln')
+
     def _generate_fallback_address(self) -> Dict:
         """Generate fallback address"""
-        street_names = ['Main', 'Oak', 'Maple', 'Cedar', 'Elm', 'Washington']
-        suffixes = ['St', 'Ave', 'Rd', 'Dr', 'Ln']
-        
-        number = random.randint(100, 9999)
-        street = random.choice(street_names)
-        suffix = random.choice(suffixes)
+        number = self._rng.randint(100, 9999)
+        street = self._rng.choice(self._FALLBACK_STREETS)
+        suffix = self._rng.choice(self._FALLBACK_SUFFIXES)
         
         return {
             'street': f"{number} {street} {suffix}",
@@ -390,75 +588,151 @@ class PersonGenerator:
         }
 
 
-def generate_complete_info(bin_code: str = '532959', quantity: int = 1) -> List[Dict]:
-    """Generate complete person and card information"""
+def iter_complete_info(bin_code: str = '532959', quantity: int = 1,
+                       batch_size: int = 1000) -> Iterator[Dict]:
+    """Yield complete person and card records one at a time
+
+    Cards still go through the vectorized batch path in chunks of
+    `batch_size`, but records are yielded as they are built, so callers
+    can stream arbitrarily large runs in constant memory.
+    """
     card_gen = CardGenerator()
     person_gen = PersonGenerator()
-    
-    results = []
-    
-    for i in range(quantity):
-        card = card_gen.generate_card(bin_code)
-        name = person_gen.generate_name()
-        address = person_gen.generate_address()
-        
-        result = {
-            'name': name,
-            'card': card,
-            'address': address,
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        }
-        
-        results.append(result)
-    
+
+    # One timestamp for the whole batch instead of a clock read per record
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    remaining = quantity
+    while remaining > 0:
+        chunk = min(remaining, batch_size)
+
+        for card in card_gen.generate_cards(bin_code, chunk):
+            yield {
+                'name': person_gen.generate_name(),
+                'card': card,
+                'address': person_gen.generate_address(),
+                'timestamp': timestamp
+            }
+
+        remaining -= chunk
+
+
+def generate_complete_info(bin_code: str = '532959', quantity: int = 1) -> List[Dict]:
+    """Generate complete person and card information"""
+    return list(iter_complete_info(bin_code, quantity))
+
+
+# Per-process generators, built once by the pool initializer so workers
+# do not reload the databases for every chunk
+_worker_card_gen = None
+_worker_person_gen = None
+
+
+def _init_worker():
+    """Initialize one worker process"""
+    global _worker_card_gen, _worker_person_gen
+    _worker_card_gen = CardGenerator()
+    _worker_person_gen = PersonGenerator()
+
+
+def _generate_chunk(bin_code: str, chunk: int, timestamp: str) -> List[Dict]:
+    """Generate one chunk of records inside a worker process"""
+    return [{
+        'name': _worker_person_gen.generate_name(),
+        'card': card,
+        'address': _worker_person_gen.generate_address(),
+        'timestamp': timestamp
+    } for card in _worker_card_gen.generate_cards(bin_code, chunk)]
+
+
+def generate_complete_info_parallel(bin_code: str = '532959', quantity: int = 1,
+                                    workers: Optional[int] = None) -> List[Dict]:
+    """Generate complete info across a process pool
+
+    Records are independent, so the batch is split into chunks and farmed
+    out to worker processes; each worker constructs its generators (and
+    loads the databases) once. Small batches fall back to the in-process
+    path, where pool startup would cost more than it saves.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1 or quantity < 1000:
+        return generate_complete_info(bin_code, quantity)
+
+    chunk = max(1, quantity // (workers * 4))
+    sizes = [chunk] * (quantity // chunk)
+    if quantity % chunk:
+        sizes.append(quantity % chunk)
+
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        results = []
+        for part in pool.map(_generate_chunk, repeat(bin_code), sizes, repeat(timestamp)):
+            results.extend(part)
+
     return results
 
 
-def save_to_file(data: List[Dict], filename: str = 'generated_cards.txt'):
-    """Save to file"""
+def _format_record(idx: int, item: Dict) -> str:
+    """Format one record for the output file"""
+    card = item['card']
+    addr = item['address']
+
+    return (
+        f"{'=' * 80}\n"
+        f"Record #{idx}\n"
+        f"{'=' * 80}\n\n"
+        "【Person Information】\n"
+        f"Name: {item['name']}\n"
+        f"Generated: {item['timestamp']}\n\n"
+        "【Card Information】\n"
+        f"Card Number: {card['cardNumber']}\n"
+        f"Formatted: {card['cardNumberFormatted']}\n"
+        f"Expiry: {card['expiryDate']}\n"
+        f"CVV: {card['cvv']}\n"
+        f"Brand: {card['brand']}\n"
+        f"Bank: {card['bank']}\n"
+        f"Country: {card['countryName']} ({card['country']})\n\n"
+        "【Address Information】\n"
+        f"Street: {addr['street']}\n"
+        f"City: {addr['city']}\n"
+        f"State: {addr['state']}\n"
+        f"ZIP: {addr['zip']}\n"
+        f"Country: {addr['country']}\n"
+        f"Source: {addr['source']}\n\n"
+        "【Simple Format】\n"
+        f"{card['cardNumber']}|{card['expiryDate']}|{card['cvv']}\n"
+        f"{item['name']}\n"
+        f"{addr['street']}, {addr['city']}, {addr['state']} {addr['zip']}\n\n"
+    )
+
+
+def save_to_file(data: Iterable[Dict], filename: str = 'generated_cards.txt',
+                 quantity: Optional[int] = None):
+    """Save to file, consuming `data` incrementally
+
+    `data` may be a generator (e.g. iter_complete_info); records are
+    written as they arrive, so nothing is retained in memory. `quantity`
+    is only needed for the header when `data` has no len().
+    """
+    if quantity is None:
+        quantity = len(data)
+
+    header = (
+        "=" * 80 + "\n"
+        "Card Helper v1.0 - Card and Person Information Generator\n"
+        f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+        f"Quantity: {quantity} records\n"
+        + "=" * 80 + "\n\n"
+    )
+
     with open(filename, 'w', encoding='utf-8') as f:
-        f.write("=" * 80 + "\n")
-        f.write("Card Helper v1.0 - Card and Person Information Generator\n")
-        f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"Quantity: {len(data)} records\n")
-        f.write("=" * 80 + "\n\n")
-        
+        f.write(header)
+
         for idx, item in enumerate(data, 1):
-            f.write(f"{'=' * 80}\n")
-            f.write(f"Record #{idx}\n")
-            f.write(f"{'=' * 80}\n\n")
-            
-            # Person info
-            f.write("【Person Information】\n")
-            f.write(f"Name: {item['name']}\n")
-            f.write(f"Generated: {item['timestamp']}\n\n")
-            
-            # Card info
-            card = item['card']
-            f.write("【Card Information】\n")
-            f.write(f"Card Number: {card['cardNumber']}\n")
-            f.write(f"Formatted: {card['cardNumberFormatted']}\n")
-            f.write(f"Expiry: {card['expiryDate']}\n")
-            f.write(f"CVV: {card['cvv']}\n")
-            f.write(f"Brand: {card['brand']}\n")
-            f.write(f"Bank: {card['bank']}\n")
-            f.write(f"Country: {card['countryName']} ({card['country']})\n\n")
-            
-            # Address info
-            addr = item['address']
-            f.write("【Address Information】\n")
-            f.write(f"Street: {addr['street']}\n")
-            f.write(f"City: {addr['city']}\n")
-            f.write(f"State: {addr['state']}\n")
-            f.write(f"ZIP: {addr['zip']}\n")
-            f.write(f"Country: {addr['country']}\n")
-            f.write(f"Source: {addr['source']}\n\n")
-            
-            # Simple format
-            f.write("【Simple Format】\n")
-            f.write(f"{card['cardNumber']}|{card['expiryDate']}|{card['cvv']}\n")
-            f.write(f"{item['name']}\n")
-            f.write(f"{addr['street']}, {addr['city']}, {addr['state']} {addr['zip']}\n\n")
+            f.write(_format_record(idx, item))
 
 
 if __name__ == '__main__':
@@ -7,9 +7,17 @@ Selects random debit cards from different countries that meet bin-database.json
 import csv
 import json
 import random
+import re
 from collections import defaultdict
 from pathlib import Path
 
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:
+    # pandas is optional; without it ingest falls back to the csv module
+    pd = None
+
 def load_bin_database(json_path):
     """Load and analyze the bin-database.json to understand required fields"""
     with open(json_path, 'r') as f:
@@ -25,6 +33,19 @@ def load_bin_database(json_path):
     print(f"✓ Required fields: {', '.join(sorted(required_fields))}")
     return data, required_fields
 
+# Brand classification, compiled once instead of an elif chain per row
+_BRAND_RE = re.compile(r'amex|americanexpress|visa|master(?:card)?|discover|jcb|diners(?:club)?')
+_CANON = {'americanexpress': 'amex', 'master': 'mastercard', 'diners': 'dinersclub'}
+_SPEC = {
+    'amex': ('American Express', 15, 4),
+    'visa': ('Visa', 16, 3),
+    'mastercard': ('Mastercard', 16, 3),
+    'discover': ('Discover', 16, 3),
+    'jcb': ('JCB', 16, 3),
+    'dinersclub': ('Diners Club', 14, 3),
+    'unknown': ('Private Label', 16, 3)
+}
+
 def validate_card_entry(row, required_fields):
     """
     Validate that a card entry has all required fields from bin-database.json
@@ -46,40 +67,15 @@ def validate_card_entry(row, required_fields):
         'cvvLength': 3  # Default
     }
     
-    # Set proper length and CVV based on scheme
-    if 'amex' in entry['scheme'] or entry['scheme'] == 'americanexpress':
-        entry['scheme'] = 'amex'
-        entry['brand'] = 'American Express'
-        entry['length'] = 15
-        entry['cvvLength'] = 4
-    elif 'visa' in entry['scheme']:
-        entry['scheme'] = 'visa'
-        entry['brand'] = 'Visa'
-        entry['length'] = 16
-        entry['cvvLength'] = 3
-    elif 'mastercard' in entry['scheme'] or 'master' in entry['scheme']:
-        entry['scheme'] = 'mastercard'
-        entry['brand'] = 'Mastercard'
-        entry['length'] = 16
-        entry['cvvLength'] = 3
-    elif 'discover' in entry['scheme']:
-        entry['scheme'] = 'discover'
-        entry['brand'] = 'Discover'
-        entry['length'] = 16
-        entry['cvvLength'] = 3
-    elif 'jcb' in entry['scheme']:
-        entry['scheme'] = 'jcb'
-        entry['brand'] = 'JCB'
-        entry['length'] = 16
-        entry['cvvLength'] = 3
-    elif 'dinersclub' in entry['scheme'] or 'diners' in entry['scheme']:
-        entry['scheme'] = 'dinersclub'
-        entry['brand'] = 'Diners Club'
-        entry['length'] = 14
-        entry['cvvLength'] = 3
-    elif 'private' in entry['scheme'].lower() or 'label' in entry['brand'].lower():
+    # Set proper length and CVV based on scheme: one regex scan + table lookup
+    match = _BRAND_RE.search(entry['scheme'])
+    if match:
+        scheme = _CANON.get(match.group(), match.group())
+        entry['scheme'] = scheme
+        entry['brand'], entry['length'], entry['cvvLength'] = _SPEC[scheme]
+    elif 'private' in entry['scheme'] or 'label' in entry['brand'].lower():
         entry['scheme'] = 'unknown'
-        entry['brand'] = 'Private Label'
+        entry['brand'] = _SPEC['unknown'][0]
     
     # Validate required fields are present and not empty
     for field in required_fields:
@@ -92,10 +88,117 @@ def validate_card_entry(row, required_fields):
     
     return True, entry
 
+def _load_valid_cards_csv(csv_path, required_fields):
+    """Stream the CSV positionally, rejecting non-debit rows before any dict work
+
+    csv.reader with column indices avoids building a dict for the ~70% of
+    binlist rows that are CREDIT/unknown and get discarded immediately.
+    """
+    all_cards = []
+    country_to_indices = defaultdict(list)
+    total_processed = 0
+
+    with open(csv_path, 'r', encoding='utf-8') as f:
+        reader = csv.reader(f)
+
+        header = next(reader)
+        bin_idx, brand_idx, type_idx, issuer_idx, country_idx, alpha_2_idx = (
+            header.index(name) for name in ('bin', 'brand', 'type', 'issuer', 'country', 'alpha_2'))
+
+        for row in reader:
+            if not row:
+                continue
+            total_processed += 1
+
+            # Show progress every 50k rows
+            if total_processed % 50000 == 0:
+                print(f"   Processed {total_processed:,} rows, found {len(all_cards):,} valid debit cards...")
+
+            # Skip non-debit rows before allocating anything per row
+            if row[type_idx].upper() != 'DEBIT':
+                continue
+
+            is_valid, entry = validate_card_entry({
+                'brand': row[brand_idx],
+                'type': row[type_idx],
+                'issuer': row[issuer_idx],
+                'country': row[country_idx],
+                'alpha_2': row[alpha_2_idx]
+            }, required_fields)
+
+            if is_valid:
+                country_to_indices[entry['country']].append(len(all_cards))
+                all_cards.append({
+                    'bin': row[bin_idx],
+                    'entry': entry
+                })
+
+    return all_cards, country_to_indices, total_processed
+
+def _load_valid_cards_pandas(csv_path, required_fields):
+    """Load the CSV columnar with pandas and classify brands vectorized
+
+    Mirrors validate_card_entry, but does the DEBIT filter, scheme
+    normalization, and the brand cascade as whole-column operations
+    instead of one dict per row.
+    """
+    df = pd.read_csv(csv_path,
+                     usecols=['bin', 'brand', 'type', 'issuer', 'country', 'alpha_2'],
+                     dtype=str).fillna('')
+    total_processed = len(df)
+
+    # Keep only debit cards before any further work
+    df = df[df['type'].str.upper() == 'DEBIT']
+
+    # Require a valid 2-letter country code and a country name
+    df = df[(df['alpha_2'].str.len() == 2) & (df['country'] != '')]
+
+    scheme = df['brand'].str.lower().str.replace(' ', '', regex=False)
+    scheme = scheme.where(scheme != '', 'unknown')
+    brand = df['brand'].where(df['brand'] != '', 'Unknown')
+
+    # Same classification as validate_card_entry, via the shared regex + table
+    matched = scheme.str.extract(f'({_BRAND_RE.pattern})', expand=False).replace(_CANON)
+    is_private = matched.isna() & (scheme.str.contains('private', regex=False)
+                                   | brand.str.lower().str.contains('label', regex=False))
+    matched = matched.mask(is_private, 'unknown')
+
+    schemes = matched.fillna(scheme)
+    brands = matched.map({k: v[0] for k, v in _SPEC.items()}).fillna(brand)
+    lengths = matched.map({k: v[1] for k, v in _SPEC.items()}).fillna(16).astype(int)
+    cvv_lengths = matched.map({k: v[2] for k, v in _SPEC.items()}).fillna(3).astype(int)
+
+    banks = df['issuer'].where(df['issuer'] != '', 'Various')
+
+    all_cards = []
+    country_to_indices = defaultdict(list)
+
+    rows = zip(df['bin'], schemes, brands, banks, df['alpha_2'], df['country'], lengths, cvv_lengths)
+    for bin_code, scheme_, brand_, bank, alpha_2, country_name, length, cvv_length in rows:
+        entry = {
+            'scheme': scheme_,
+            'type': 'debit',
+            'brand': brand_,
+            'bank': bank,
+            'country': alpha_2,
+            'countryName': country_name,
+            'length': int(length),
+            'cvvLength': int(cvv_length)
+        }
+
+        # Validate required fields are present and not empty
+        if any(field not in entry or not entry[field] for field in required_fields):
+            continue
+
+        country_to_indices[alpha_2].append(len(all_cards))
+        all_cards.append({'bin': bin_code, 'entry': entry})
+
+    return all_cards, country_to_indices, total_processed
+
 def select_random_cards(csv_path, json_path, num_cards=10, prioritize_diversity=True):
     """
     Select random debit cards from CSV that meet bin-database.json requirements
-    
+
     Args:
         csv_path: Path to binlist-data.csv
         json_path: Path to bin-database.json
@@ -104,66 +207,45 @@ def select_random_cards(csv_path, json_path, num_cards=10, prioritize_diversity=
     """
     # Load bin database to understand requirements
     bin_db, required_fields = load_bin_database(json_path)
-    
-    # Group cards by country
-    cards_by_country = defaultdict(list)
-    total_valid = 0
-    total_processed = 0
-    
+
     print(f"\n📖 Reading {csv_path}...")
-    
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        
-        for row in reader:
-            total_processed += 1
-            
-            # Show progress every 50k rows
-            if total_processed % 50000 == 0:
-                print(f"   Processed {total_processed:,} rows, found {total_valid:,} valid debit cards...")
-            
-            is_valid, entry = validate_card_entry(row, required_fields)
-            
-            if is_valid:
-                cards_by_country[entry['country']].append({
-                    'bin': row['bin'],
-                    'entry': entry
-                })
-                total_valid += 1
-    
+
+    if pd is not None:
+        all_cards, country_to_indices, total_processed = _load_valid_cards_pandas(csv_path, required_fields)
+    else:
+        all_cards, country_to_indices, total_processed = _load_valid_cards_csv(csv_path, required_fields)
+
     print(f"✓ Processed {total_processed:,} total rows")
-    print(f"✓ Found {total_valid:,} valid debit cards")
-    print(f"✓ From {len(cards_by_country)} different countries")
-    
+    print(f"✓ Found {len(all_cards):,} valid debit cards")
+    print(f"✓ From {len(country_to_indices)} different countries")
+
     # Select cards
     selected_cards = []
-    
+
     if prioritize_diversity:
         print(f"\n🎲 Selecting {num_cards} cards (prioritizing country diversity)...")
-        
+
         # Get list of countries sorted by number of cards (for better distribution)
-        countries = list(cards_by_country.keys())
+        countries = list(country_to_indices.keys())
         random.shuffle(countries)
-        
+
         # Select one card from each country first
         for country in countries:
             if len(selected_cards) >= num_cards:
                 break
-            card = random.choice(cards_by_country[country])
-            selected_cards.append(card)
-        
-        # If we need more cards, randomly select from remaining
+            selected_cards.append(all_cards[random.choice(country_to_indices[country])])
+
+        # If we need more cards, sample indices instead of flattening all cards
         if len(selected_cards) < num_cards:
-            all_cards = [card for cards in cards_by_country.values() for card in cards]
             remaining = num_cards - len(selected_cards)
-            additional = random.sample(all_cards, min(remaining, len(all_cards)))
-            selected_cards.extend(additional)
+            additional = random.sample(range(len(all_cards)), min(remaining, len(all_cards)))
+            selected_cards.extend(all_cards[idx] for idx in additional)
     else:
         print(f"\n🎲 Selecting {num_cards} cards (random selection)...")
-        all_cards = [card for cards in cards_by_country.values() for card in cards]
-        selected_cards = random.sample(all_cards, min(num_cards, len(all_cards)))
-    
-    return selected_cards, cards_by_country
+        selected_cards = [all_cards[idx] for idx in
+                          random.sample(range(len(all_cards)), min(num_cards, len(all_cards)))]
+
+    return selected_cards, country_to_indices
 
 def display_results(selected_cards):
     """Display selected cards in a formatted way"""
@@ -220,16 +302,13 @@ def main():
     print("COUNTRY DISTRIBUTION IN SELECTION")
     print("=" * 80)
     country_count = defaultdict(int)
+    country_names = {}
     for card in selected_cards:
         country_count[card['entry']['country']] += 1
-    
+        country_names.setdefault(card['entry']['country'], card['entry']['countryName'])
+
     for country, count in sorted(country_count.items()):
-        country_name = selected_cards[0]['entry']['countryName'] if selected_cards else ''
-        for card in selected_cards:
-            if card['entry']['country'] == country:
-                country_name = card['entry']['countryName']
-                break
-        print(f"  {country} ({country_name}): {count} card(s)")
+        print(f"  {country} ({country_names[country]}): {count} card(s)")
     
     print()
     